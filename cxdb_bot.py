@@ -18,12 +18,18 @@ Fork = new topic + new cxdb branch.
 import logging
 import os
 import re
+import shlex
 import signal
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import zulip
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add Oracle-Cortex scripts to path for cxdb client
 sys.path.insert(0, "/home/devuser/Oracle-Cortex/scripts")
@@ -37,6 +43,8 @@ CHANNEL = "cxdb"
 BOT_EMAIL_PREFIX = "cxdb-bot"
 LOG_DIR = Path.home() / ".cxdb/logs"
 PID_FILE = Path.home() / ".cxdb/cxdb-bot.pid"
+CACHE_TTL = 5.0  # seconds before a cached cxdb read counts as stale
+MAX_MESSAGE_LEN = 9000  # Zulip rejects bodies over 10000 chars; leave headroom
 
 # Logging
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -53,6 +61,131 @@ log = logging.getLogger("cxdb-bot")
 # Regex patterns
 CTX_PATTERN = re.compile(r'CTX-(\d+)')
 FORK_PATTERN = re.compile(r'CTX-(\d+):(\d+)')
+MENTION_RE = re.compile(r'@\*\*[^*]+\*\*\s*')
+REWARD_RE = re.compile(r'CTX-\d+\s+([\d.]+)')
+REASON_RE = re.compile(r'[\d.]+\s+(.+)')
+FORK_DESC_RE = re.compile(r'CTX-\d+:\d+\s+(.+)', re.IGNORECASE)
+RECORD_STRIP_RE = re.compile(r'record\s+CTX-\d+\s+', re.IGNORECASE)
+CMD_RE = re.compile(r'^(sessions|list|show|fork|compare|score|search|record|help)\b', re.IGNORECASE)
+
+# Turn type ids
+SESSION_META_TYPE = "com.oracle.agent.SessionMeta"
+TOOL_CALL_TYPE = "com.oracle.agent.ToolCall"
+CONVERSATION_TURN_TYPE = "com.oracle.conversation.Turn"
+
+
+# Help text is static; render it once instead of rebuilding per request
+HELP_TEXT = """**cxdb Bot** - Conversation Branching
+
+| Command | Description |
+|---------|-------------|
+| `sessions` | List recent contexts |
+| `show CTX-<id>` | Show turns from a context |
+| `fork CTX-<id>:<turn> "desc"` | Fork at a turn → new topic |
+| `compare CTX-1 CTX-2 CTX-3` | Side-by-side branch comparison |
+| `score CTX-<id> 0.85 "reason"` | Attach reward signal |
+| `record CTX-<id> <role> <text>` | Append a turn |
+| `search <query>` | Search across all contexts |
+
+**Linking**: Any `CTX-N` in messages/topics auto-links to the context data.
+**Topics**: Each context maps to a `[CTX-N] description` topic.
+**Forks**: `fork` creates both a cxdb branch and a new Zulip topic with back-link.
+
+Python API: `from cortex.cxdb_client import CxdbClient`
+Docs: `/home/devuser/Oracle-Cortex/docs/cxdb-conversation-branching.md`"""
+
+
+def _turn_reward(data: dict):
+    """Reward signal from a turn payload, or None.
+
+    Decodes the field-4 metadata in one place so render sites do a single
+    call instead of repeating the dict-lookup + isinstance dance per turn.
+    """
+    meta = data.get(4)
+    if type(meta) is dict:
+        return meta.get("reward")
+    return None
+
+
+def _session_row(ctx: dict) -> str:
+    depth = ctx.get("head_depth", 0)
+    tag = ctx.get("client_tag", "-")
+    live = "yes" if ctx.get("is_live") else ""
+    return f"| CTX-{ctx['context_id']} | {depth} | {depth} | {tag} | {live} |"
+
+
+def _show_lines(turns):
+    """Yield one rendered line per turn for _handle_show."""
+    for t in turns:
+        data = t.data
+        if data is None:
+            yield f"- Turn {t.turn_id} (depth {t.depth}): `{t.type_id}` [no payload]"
+            continue
+
+        if t.type_id == SESSION_META_TYPE:
+            agent = data.get(2, "?")
+            trigger = data.get(4, "?")
+            stream = data.get(5, "")
+            topic = data.get(6, "")
+            loc = f" in #{stream} > {topic}" if stream else ""
+            yield f"- **Session** `{data.get(1, '?')}` by `{agent}` (trigger: {trigger}{loc})"
+        elif t.type_id == TOOL_CALL_TYPE:
+            tool = data.get(1, "?")
+            status = data.get(6, "ok")
+            dur = data.get(5, 0)
+            icon = "white_check_mark" if status == "ok" else "x"
+            yield f"- :{icon}: **{tool}** ({dur}ms) @ turn {t.turn_id}"
+        else:
+            role = data.get(1, "?")
+            content_text = data.get(2, "")
+            # Truncate long content
+            if len(content_text) > 200:
+                content_text = content_text[:200] + "..."
+            reward = _turn_reward(data)
+            reward_str = f" | **reward: {reward}**" if reward else ""
+            yield f"- **[{role}]** (turn {t.turn_id}, depth {t.depth}{reward_str}): {content_text}"
+
+
+def _chunk_content(content: str):
+    """Yield message-sized chunks of content, splitting on line boundaries."""
+    if len(content) <= MAX_MESSAGE_LEN:
+        yield content
+        return
+
+    buf = []
+    size = 0
+    for line in content.split("\n"):
+        while len(line) > MAX_MESSAGE_LEN:
+            chunk = "\n".join(buf)
+            if chunk:
+                yield chunk
+            buf, size = [], 0
+            yield line[:MAX_MESSAGE_LEN]
+            line = line[MAX_MESSAGE_LEN:]
+        if buf and size + len(line) + 1 > MAX_MESSAGE_LEN:
+            # A buffer holding only blank lines joins to "", which Zulip
+            # rejects as an empty message — skip it
+            chunk = "\n".join(buf)
+            if chunk:
+                yield chunk
+            buf, size = [], 0
+        buf.append(line)
+        size += len(line) + 1
+    chunk = "\n".join(buf)
+    if chunk:
+        yield chunk
+
+
+def _split_args(tail: str) -> list:
+    """Tokenize a command tail, honoring quoted phrases.
+
+    Falls back to plain whitespace splitting when quoting is unbalanced
+    (e.g. an apostrophe in free-form text).
+    """
+    try:
+        return shlex.split(tail)
+    except ValueError:
+        return tail.split()
 
 
 class CxdbBot:
@@ -60,10 +193,48 @@ class CxdbBot:
 
     def __init__(self):
         self.zulip = zulip.Client(config_file=str(ZULIP_RC))
+        # Reuse one pooled HTTPS session for all Zulip API calls instead of
+        # paying a TCP/TLS handshake per request.
+        self.zulip.ensure_session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+        )
+        self.zulip.session.mount("https://", adapter)
+        self.zulip.session.mount("http://", adapter)
+        self.bot_email = self.zulip.get_profile()["email"]
         self.cxdb = CxdbClient(client_tag="cxdb-zulip-bot")
-        self.explorer = BranchExplorer(client=self.cxdb)
-        self.browser = SessionBrowser(client=self.cxdb)
+        # Explorer/browser are built lazily on first use; both share the
+        # one CxdbClient so no extra connections are opened at startup
+        self._explorer = None
+        self._browser = None
         self.running = True
+        self._cxdb_cache = {}
+        self._cache_refreshing = set()
+        self._handlers = {
+            "sessions": self._handle_sessions,
+            "list": self._handle_sessions,
+            "show": self._handle_show,
+            "fork": self._handle_fork,
+            "compare": self._handle_compare,
+            "score": self._handle_score,
+            "search": self._handle_search,
+            "record": self._handle_record,
+            "help": self._handle_help,
+        }
+
+    @property
+    def explorer(self) -> BranchExplorer:
+        if self._explorer is None:
+            self._explorer = BranchExplorer(client=self.cxdb)
+        return self._explorer
+
+    @property
+    def browser(self) -> SessionBrowser:
+        if self._browser is None:
+            self._browser = SessionBrowser(client=self.cxdb)
+        return self._browser
 
     def start(self):
         """Start the bot."""
@@ -75,7 +246,43 @@ class CxdbBot:
         signal.signal(signal.SIGINT, self._shutdown)
 
         log.info(f"Listening on #{CHANNEL}")
-        self.zulip.call_on_each_message(self._handle_message)
+        self._event_loop()
+
+    def _register_queue(self) -> tuple:
+        """Register an event queue narrowed to #cxdb messages."""
+        res = self.zulip.register(
+            event_types=["message"],
+            narrow=[["stream", CHANNEL]],
+        )
+        return res["queue_id"], res["last_event_id"]
+
+    def _event_loop(self):
+        """Long-poll the narrowed event queue instead of call_on_each_message.
+
+        The server filters events down to #cxdb messages for us, and the
+        blocking get_events call returns as soon as something arrives.
+        """
+        queue_id, last_event_id = self._register_queue()
+
+        while self.running:
+            result = self.zulip.get_events(
+                queue_id=queue_id,
+                last_event_id=last_event_id,
+                dont_block=False,
+            )
+            if result.get("result") != "success":
+                if result.get("code") == "BAD_EVENT_QUEUE_ID":
+                    log.warning("Event queue expired, re-registering")
+                    queue_id, last_event_id = self._register_queue()
+                else:
+                    log.warning(f"get_events failed: {result.get('msg')}")
+                    time.sleep(1)
+                continue
+
+            for event in result["events"]:
+                last_event_id = max(last_event_id, event["id"])
+                if event["type"] == "message":
+                    self._handle_message(event["message"])
 
     def _shutdown(self, signum, frame):
         log.info(f"Shutdown signal {signum}")
@@ -104,13 +311,16 @@ class CxdbBot:
             log.info(f"Subscribed to #{CHANNEL}")
 
     def _reply(self, msg: dict, content: str):
-        """Reply in the same topic."""
-        self.zulip.send_message({
-            "type": "stream",
-            "to": msg.get("display_recipient", CHANNEL),
-            "topic": msg.get("subject", "general"),
-            "content": content,
-        })
+        """Reply in the same topic, chunking bodies Zulip would reject."""
+        to = msg.get("display_recipient", CHANNEL)
+        topic = msg.get("subject", "general")
+        for chunk in _chunk_content(content):
+            self.zulip.send_message({
+                "type": "stream",
+                "to": to,
+                "topic": topic,
+                "content": chunk,
+            })
 
     def _post(self, topic: str, content: str):
         """Post to a specific topic in #cxdb."""
@@ -130,11 +340,48 @@ class CxdbBot:
         except Exception:
             pass
 
+    # ── Read caching ────────────────────────────────────────────
+
+    def _cached(self, key: tuple, fetch):
+        """Return a cached cxdb read, refreshing stale entries off the hot path.
+
+        Fresh entries (< CACHE_TTL old) are returned directly. Stale ones
+        are served immediately while a background thread revalidates, so
+        repeated sessions/show commands never wait on cxdb twice in a row.
+        """
+        now = time.monotonic()
+        entry = self._cxdb_cache.get(key)
+        if entry is not None:
+            fetched_at, value = entry
+            if now - fetched_at >= CACHE_TTL and key not in self._cache_refreshing:
+                self._cache_refreshing.add(key)
+                threading.Thread(
+                    target=self._refresh_cache, args=(key, fetch), daemon=True
+                ).start()
+            return value
+
+        value = fetch()
+        self._cxdb_cache[key] = (now, value)
+        return value
+
+    def _refresh_cache(self, key: tuple, fetch):
+        try:
+            self._cxdb_cache[key] = (time.monotonic(), fetch())
+        except Exception:
+            self._cxdb_cache.pop(key, None)
+        finally:
+            self._cache_refreshing.discard(key)
+
+    def _invalidate_cache(self):
+        """Drop cached reads after a write (fork/score/record)."""
+        self._cxdb_cache.clear()
+
     # ── Message routing ─────────────────────────────────────────
 
     def _handle_message(self, msg: dict):
         """Route incoming messages."""
-        if msg.get("sender_email", "").startswith(BOT_EMAIL_PREFIX):
+        # Cheapest checks first: drop our own echoes before touching content
+        if msg.get("sender_email") == self.bot_email:
             return
 
         if msg.get("type") != "stream":
@@ -148,28 +395,17 @@ class CxdbBot:
             if "@**cxdb Bot**" not in content and f"@**{BOT_EMAIL_PREFIX}**" not in content:
                 return
 
-        # Strip bot mention
-        text = re.sub(r'@\*\*[^*]+\*\*\s*', '', content).strip().lower()
-        text_raw = re.sub(r'@\*\*[^*]+\*\*\s*', '', content).strip()
+        # Strip bot mention once, then dispatch on the command word
+        text = MENTION_RE.sub('', content, count=1).strip()
+        if not text:
+            return
+
+        cmd_match = CMD_RE.match(text)
 
         try:
-            if text.startswith("sessions") or text.startswith("list"):
-                self._handle_sessions(msg)
-            elif text.startswith("show"):
-                self._handle_show(msg, text_raw)
-            elif text.startswith("fork"):
-                self._handle_fork(msg, text_raw)
-            elif text.startswith("compare"):
-                self._handle_compare(msg, text_raw)
-            elif text.startswith("score"):
-                self._handle_score(msg, text_raw)
-            elif text.startswith("search"):
-                self._handle_search(msg, text_raw)
-            elif text.startswith("record"):
-                self._handle_record(msg, text_raw)
-            elif text.startswith("help"):
-                self._handle_help(msg)
-            elif text:
+            if cmd_match:
+                self._handlers[cmd_match.group(1).lower()](msg, text)
+            else:
                 # Default: show help for unrecognized commands
                 self._handle_help(msg)
         except CxdbError as e:
@@ -180,27 +416,23 @@ class CxdbBot:
 
     # ── Commands ────────────────────────────────────────────────
 
-    def _handle_sessions(self, msg: dict):
+    def _handle_sessions(self, msg: dict, text: str = ""):
         """List recent contexts."""
         self._react(msg)
-        contexts = self.cxdb.list_contexts(limit=20)
+        contexts = self._cached(
+            ("contexts", 20), lambda: self.cxdb.list_contexts(limit=20)
+        )
 
         if not contexts:
             self._reply(msg, "No contexts yet. Use `record` or the Python API to create sessions.")
             return
 
-        lines = ["**Recent Contexts**\n"]
-        lines.append("| Context | Depth | Turns | Tag | Live |")
-        lines.append("|---------|-------|-------|-----|------|")
-
-        for ctx in contexts:
-            ctx_id = ctx["context_id"]
-            depth = ctx.get("head_depth", 0)
-            tag = ctx.get("client_tag", "-")
-            live = "yes" if ctx.get("is_live") else ""
-            lines.append(f"| CTX-{ctx_id} | {depth} | {depth} | {tag} | {live} |")
-
-        self._reply(msg, "\n".join(lines))
+        header = (
+            "**Recent Contexts**\n\n"
+            "| Context | Depth | Turns | Tag | Live |\n"
+            "|---------|-------|-------|-----|------|\n"
+        )
+        self._reply(msg, header + "\n".join(_session_row(ctx) for ctx in contexts))
 
     def _handle_show(self, msg: dict, text: str):
         """Show turns from a context."""
@@ -211,46 +443,16 @@ class CxdbBot:
 
         self._react(msg)
         ctx_id = int(match.group(1))
-        turns = self.cxdb.get_last(ctx_id, limit=30)
+        turns = self._cached(
+            ("turns", ctx_id, 30), lambda: self.cxdb.get_last(ctx_id, limit=30)
+        )
 
         if not turns:
             self._reply(msg, f"CTX-{ctx_id}: no turns found.")
             return
 
-        lines = [f"**CTX-{ctx_id}** ({len(turns)} turns)\n"]
-        for t in turns:
-            data = t.data
-            if data is None:
-                lines.append(f"- Turn {t.turn_id} (depth {t.depth}): `{t.type_id}` [no payload]")
-                continue
-
-            type_short = t.type_id.split(".")[-1]
-
-            if t.type_id == "com.oracle.agent.SessionMeta":
-                agent = data.get(2, "?")
-                trigger = data.get(4, "?")
-                stream = data.get(5, "")
-                topic = data.get(6, "")
-                loc = f" in #{stream} > {topic}" if stream else ""
-                lines.append(f"- **Session** `{data.get(1, '?')}` by `{agent}` (trigger: {trigger}{loc})")
-            elif t.type_id == "com.oracle.agent.ToolCall":
-                tool = data.get(1, "?")
-                status = data.get(6, "ok")
-                dur = data.get(5, 0)
-                icon = "white_check_mark" if status == "ok" else "x"
-                lines.append(f"- :{icon}: **{tool}** ({dur}ms) @ turn {t.turn_id}")
-            else:
-                role = data.get(1, "?")
-                content_text = data.get(2, "")
-                # Truncate long content
-                if len(content_text) > 200:
-                    content_text = content_text[:200] + "..."
-                meta = data.get(4, {})
-                reward = meta.get("reward") if isinstance(meta, dict) else None
-                reward_str = f" | **reward: {reward}**" if reward else ""
-                lines.append(f"- **[{role}]** (turn {t.turn_id}, depth {t.depth}{reward_str}): {content_text}")
-
-        self._reply(msg, "\n".join(lines))
+        header = f"**CTX-{ctx_id}** ({len(turns)} turns)\n\n"
+        self._reply(msg, header + "\n".join(_show_lines(turns)))
 
     def _handle_fork(self, msg: dict, text: str):
         """Fork a context at a specific turn."""
@@ -265,11 +467,12 @@ class CxdbBot:
         turn_id = int(match.group(2))
 
         # Extract description (everything after the CTX-N:M pattern)
-        desc_match = re.search(r'CTX-\d+:\d+\s+(.+)', text, re.IGNORECASE)
-        description = desc_match.group(1).strip().strip('"\'') if desc_match else f"Fork from CTX-{ctx_id} turn {turn_id}"
+        desc_match = FORK_DESC_RE.search(text)
+        description = " ".join(_split_args(desc_match.group(1))) if desc_match else f"Fork from CTX-{ctx_id} turn {turn_id}"
 
         # Create the fork
         fork = self.cxdb.fork(turn_id)
+        self._invalidate_cache()
         new_topic = f"[CTX-{fork.context_id}] {description}"
 
         # Post in the new topic
@@ -302,20 +505,18 @@ class CxdbBot:
         for ctx_id, turns in comparison.items():
             lines.append(f"### CTX-{ctx_id} ({len(turns)} turns)")
 
-            # Find the divergence point
-            conversation_turns = [
-                t for t in turns
-                if t["type_id"] == "com.oracle.conversation.Turn"
-            ]
-
-            # Show last 5 conversation turns
-            for t in conversation_turns[-5:]:
+            # Show the last 5 conversation turns; the bounded deque keeps a
+            # constant-size window instead of materializing every turn
+            window = deque(
+                (t for t in turns if t["type_id"] == CONVERSATION_TURN_TYPE),
+                maxlen=5,
+            )
+            for t in window:
                 data = t["data"]
                 if data:
                     role = data.get(1, "?")
                     content_text = str(data.get(2, ""))[:120]
-                    meta = data.get(4, {})
-                    reward = meta.get("reward") if isinstance(meta, dict) else None
+                    reward = _turn_reward(data)
                     if reward:
                         lines.append(f"- **[{role}]** {content_text} | **reward: {reward}**")
                     else:
@@ -323,19 +524,21 @@ class CxdbBot:
 
             lines.append("")
 
-        # Find shared turns
-        all_turn_sets = [
-            {t["turn_id"] for t in turns}
-            for turns in comparison.values()
-        ]
-        if all_turn_sets:
-            shared = set.intersection(*all_turn_sets)
-            unique_per_branch = {
-                ctx_id: {t["turn_id"] for t in turns} - shared
-                for ctx_id, turns in comparison.items()
-            }
+        # Find shared turns with a running intersection: one set per branch
+        # is built exactly once, and shared ⊆ every branch set, so each
+        # branch's unique count is just its size minus the shared size.
+        shared = None
+        branch_sizes = {}
+        for branch_ctx_id, turns in comparison.items():
+            turn_ids = {t["turn_id"] for t in turns}
+            branch_sizes[branch_ctx_id] = len(turn_ids)
+            if shared is None:
+                shared = turn_ids
+            else:
+                shared.intersection_update(turn_ids)
+        if shared is not None:
             lines.append(f"**Shared turns**: {len(shared)} | " +
-                         " | ".join(f"CTX-{cid} unique: {len(u)}" for cid, u in unique_per_branch.items()))
+                         " | ".join(f"CTX-{cid} unique: {n - len(shared)}" for cid, n in branch_sizes.items()))
 
         self._reply(msg, "\n".join(lines))
 
@@ -350,7 +553,7 @@ class CxdbBot:
         ctx_id = int(match.group(1))
 
         # Extract reward value
-        reward_match = re.search(r'CTX-\d+\s+([\d.]+)', text)
+        reward_match = REWARD_RE.search(text)
         if not reward_match:
             self._reply(msg, "Missing reward value (0.0-1.0)")
             return
@@ -358,36 +561,52 @@ class CxdbBot:
         reward = float(reward_match.group(1))
 
         # Extract reason
-        reason_match = re.search(r'[\d.]+\s+(.+)', text[text.index(reward_match.group(1)):])
-        reason = reason_match.group(1).strip().strip('"\'') if reason_match else ""
+        reason_match = REASON_RE.search(text[text.index(reward_match.group(1)):])
+        reason = " ".join(_split_args(reason_match.group(1))) if reason_match else ""
 
         self._react(msg, "star")
         self.explorer.score_branch(ctx_id, reward=reward, reason=reason)
+        self._invalidate_cache()
 
         emoji = "star" if reward >= 0.8 else ("thumbs_up" if reward >= 0.5 else "thumbs_down")
         self._reply(msg, f":{emoji}: CTX-{ctx_id} scored **{reward}**" + (f": {reason}" if reason else ""))
 
     def _handle_search(self, msg: dict, text: str):
         """Search across all contexts for matching content."""
-        query = text[6:].strip().strip('"\'')
+        query = " ".join(_split_args(text[6:]))
         if not query:
             self._reply(msg, "Usage: `search <query>`")
             return
 
         self._react(msg)
-        contexts = self.cxdb.list_contexts(limit=50)
+        contexts = self._cached(
+            ("contexts", 50), lambda: self.cxdb.list_contexts(limit=50)
+        )
         results = []
 
-        for ctx in contexts:
-            ctx_id = int(ctx["context_id"])
-            try:
-                turns = self.cxdb.get_last(ctx_id, limit=50)
+        # Compile the case-insensitive match once instead of lowercasing
+        # both sides for every turn.
+        query_re = re.compile(re.escape(query), re.IGNORECASE)
+
+        # Fan the per-context fetches out so the round-trips overlap
+        # instead of running as 50 serial RTTs.
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [
+                (int(ctx["context_id"]),
+                 executor.submit(self.cxdb.get_last, int(ctx["context_id"]), limit=50))
+                for ctx in contexts
+            ]
+            for ctx_id, future in futures:
+                try:
+                    turns = future.result()
+                except Exception:
+                    continue
                 for t in turns:
                     data = t.data
                     if data is None:
                         continue
                     content_text = str(data.get(2, ""))
-                    if query.lower() in content_text.lower():
+                    if query_re.search(content_text):
                         results.append({
                             "ctx_id": ctx_id,
                             "turn_id": t.turn_id,
@@ -395,8 +614,6 @@ class CxdbBot:
                             "role": data.get(1, "?"),
                             "snippet": content_text[:150],
                         })
-            except Exception:
-                continue
 
         if not results:
             self._reply(msg, f'No results for "{query}"')
@@ -423,39 +640,22 @@ class CxdbBot:
         ctx_id = int(match.group(1))
 
         # Extract role and content after CTX-N
-        rest = re.sub(r'record\s+CTX-\d+\s+', '', text, flags=re.IGNORECASE).strip()
-        parts = rest.split(None, 1)
+        parts = _split_args(RECORD_STRIP_RE.sub('', text).strip())
         if len(parts) < 2:
             self._reply(msg, 'Usage: `record CTX-<id> <role> <content>`')
             return
 
-        role = parts[0].strip()
-        content_text = parts[1].strip().strip('"\'')
+        role = parts[0]
+        content_text = " ".join(parts[1:])
 
         self._react(msg, "pencil")
         turn = self.cxdb.append_turn(ctx_id, role=role, content=content_text)
+        self._invalidate_cache()
         self._reply(msg, f":pencil: Turn {turn.turn_id} appended to CTX-{ctx_id} (depth {turn.depth})")
 
-    def _handle_help(self, msg: dict):
+    def _handle_help(self, msg: dict, text: str = ""):
         """Show help message."""
-        self._reply(msg, """**cxdb Bot** - Conversation Branching
-
-| Command | Description |
-|---------|-------------|
-| `sessions` | List recent contexts |
-| `show CTX-<id>` | Show turns from a context |
-| `fork CTX-<id>:<turn> "desc"` | Fork at a turn → new topic |
-| `compare CTX-1 CTX-2 CTX-3` | Side-by-side branch comparison |
-| `score CTX-<id> 0.85 "reason"` | Attach reward signal |
-| `record CTX-<id> <role> <text>` | Append a turn |
-| `search <query>` | Search across all contexts |
-
-**Linking**: Any `CTX-N` in messages/topics auto-links to the context data.
-**Topics**: Each context maps to a `[CTX-N] description` topic.
-**Forks**: `fork` creates both a cxdb branch and a new Zulip topic with back-link.
-
-Python API: `from cortex.cxdb_client import CxdbClient`
-Docs: `/home/devuser/Oracle-Cortex/docs/cxdb-conversation-branching.md`""")
+        self._reply(msg, HELP_TEXT)
 
 
 def main():
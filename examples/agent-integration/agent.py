@@ -13,47 +13,103 @@ import requests
 import json
 import time
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+
+try:
+    # Optional fast JSON encoder; falls back to stdlib json via requests
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # CXDB HTTP API endpoint
 CXDB_HTTP = "http://localhost:9010"
 
+# Shared HTTP session: every call reuses one keep-alive connection
+# instead of opening a new TCP connection per request
+SESSION = requests.Session()
+
 # Canonical type constants
 TYPE_ID = "cxdb.ConversationItem"
 TYPE_VERSION = 3
 
 
+def _post_json(url: str, payload: Dict[str, Any]) -> requests.Response:
+    """POST a JSON body, serializing with orjson when installed."""
+    if orjson is not None:
+        return SESSION.post(
+            url,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+    return SESSION.post(url, json=payload)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _parse_json(resp: requests.Response) -> Any:
+    """Decode a JSON response, parsing with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 def create_context() -> int:
     """Create a new CXDB context."""
-    resp = requests.post(f"{CXDB_HTTP}/v1/contexts/create")
+    resp = SESSION.post(f"{CXDB_HTTP}/v1/contexts/create")
     resp.raise_for_status()
-    data = resp.json()
+    data = _parse_json(resp)
     return int(data["context_id"])
 
 
-def append_turn(context_id: int, item: Dict[str, Any]) -> Dict[str, Any]:
-    """Append a ConversationItem turn to the context."""
-    resp = requests.post(
+def append_turn(
+    context_id: int,
+    item: Dict[str, Any],
+    wait_response: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """Append a ConversationItem turn to the context.
+
+    With wait_response=False the response body is not parsed (only the
+    status is checked), for side-effect-only appends.
+    """
+    resp = _post_json(
         f"{CXDB_HTTP}/v1/contexts/{context_id}/append",
-        json={
+        {
             "type_id": TYPE_ID,
             "type_version": TYPE_VERSION,
             "data": item,
         },
     )
     resp.raise_for_status()
-    return resp.json()
+    return _parse_json(resp) if wait_response else None
+
+
+def append_turns(
+    context_id: int,
+    items: List[Dict[str, Any]],
+    wait_response: bool = True,
+) -> List[Optional[Dict[str, Any]]]:
+    """Append several ConversationItem turns back to back.
+
+    The HTTP API has no bulk-append route, so this issues one request per
+    item over the shared keep-alive session: each append costs a single
+    round-trip with no connection setup in between.
+    """
+    return [append_turn(context_id, item, wait_response=wait_response) for item in items]
 
 
 def get_turns(context_id: int, limit: int = 100) -> List[Dict[str, Any]]:
     """Retrieve turns from the context."""
-    resp = requests.get(
+    resp = SESSION.get(
         f"{CXDB_HTTP}/v1/contexts/{context_id}/turns",
         params={"limit": limit},
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = _parse_json(resp)
     return data.get("turns", [])
 
 
@@ -62,6 +118,22 @@ def timestamp_ms() -> int:
     return int(time.time() * 1000)
 
 
+_clock_cache = (None, "")
+
+
+def format_clock(ts_ms: int) -> str:
+    """Format a millisecond timestamp as HH:MM:SS.
+
+    Uses time.strftime on a struct_time (no datetime object per turn) and
+    caches the last result, since consecutive turns usually share a second.
+    """
+    global _clock_cache
+    seconds = ts_ms // 1000
+    if seconds != _clock_cache[0]:
+        _clock_cache = (seconds, time.strftime("%H:%M:%S", time.localtime(seconds)))
+    return _clock_cache[1]
+
+
 def user_input(text: str, attachments: Optional[List[Dict]] = None) -> Dict:
     """Create a user input ConversationItem."""
     return {
@@ -112,81 +184,67 @@ def simulate_agent_conversation(context_id: int):
     """Simulate a multi-turn AI agent conversation."""
     print(f"\nSimulating agent conversation in context {context_id}...\n")
 
-    # Turn 1: User asks a question
-    print("[Turn 1] User input")
-    turn1 = append_turn(
-        context_id,
-        user_input("What's the weather like in San Francisco?"),
-    )
-    print(f"  Appended turn {turn1['turn_id']}")
-
-    # Turn 2: Assistant decides to call a tool
-    print("[Turn 2] Assistant + tool call")
-    turn2 = append_turn(
-        context_id,
-        assistant_turn(
-            text="Let me check the current weather for you.",
-            tool_calls=[
-                {
-                    "call_id": "call_001",
-                    "name": "get_weather",
-                    "arguments": {
-                        "location": "San Francisco, CA",
-                        "units": "fahrenheit",
-                    },
-                    "status": "complete",
-                    "result": {
-                        "temperature": 62,
-                        "conditions": "partly cloudy",
-                        "humidity": 65,
-                        "wind_speed": 12,
-                    },
-                }
-            ],
+    # Build the whole conversation up front, then batch the appends
+    conversation = [
+        (
+            "User input",
+            user_input("What's the weather like in San Francisco?"),
         ),
-    )
-    print(f"  Appended turn {turn2['turn_id']}")
-
-    # Turn 3: Assistant provides final answer
-    print("[Turn 3] Assistant response")
-    turn3 = append_turn(
-        context_id,
-        assistant_turn(
-            text="The weather in San Francisco is currently 62°F and partly cloudy. "
-            "Humidity is at 65% with winds at 12 mph. It's a pleasant day!",
+        (
+            "Assistant + tool call",
+            assistant_turn(
+                text="Let me check the current weather for you.",
+                tool_calls=[
+                    {
+                        "call_id": "call_001",
+                        "name": "get_weather",
+                        "arguments": {
+                            "location": "San Francisco, CA",
+                            "units": "fahrenheit",
+                        },
+                        "status": "complete",
+                        "result": {
+                            "temperature": 62,
+                            "conditions": "partly cloudy",
+                            "humidity": 65,
+                            "wind_speed": 12,
+                        },
+                    }
+                ],
+            ),
         ),
-    )
-    print(f"  Appended turn {turn3['turn_id']}")
-
-    # Turn 4: User asks a follow-up
-    print("[Turn 4] User follow-up")
-    turn4 = append_turn(
-        context_id,
-        user_input("Should I bring a jacket?"),
-    )
-    print(f"  Appended turn {turn4['turn_id']}")
-
-    # Turn 5: Assistant responds
-    print("[Turn 5] Assistant response")
-    turn5 = append_turn(
-        context_id,
-        assistant_turn(
-            text="Yes, I'd recommend bringing a light jacket. While 62°F is mild, "
-            "San Francisco can feel cooler with the wind and fog, especially near the coast.",
+        (
+            "Assistant response",
+            assistant_turn(
+                text="The weather in San Francisco is currently 62°F and partly cloudy. "
+                "Humidity is at 65% with winds at 12 mph. It's a pleasant day!",
+            ),
         ),
-    )
-    print(f"  Appended turn {turn5['turn_id']}")
-
-    # Turn 6: System message (for demonstration)
-    print("[Turn 6] System info")
-    turn6 = append_turn(
-        context_id,
-        system_message(
-            "Conversation token usage: 450 tokens (350 input, 100 output)",
-            severity="info",
+        (
+            "User follow-up",
+            user_input("Should I bring a jacket?"),
         ),
-    )
-    print(f"  Appended turn {turn6['turn_id']}")
+        (
+            "Assistant response",
+            assistant_turn(
+                text="Yes, I'd recommend bringing a light jacket. While 62°F is mild, "
+                "San Francisco can feel cooler with the wind and fog, especially near the coast.",
+            ),
+        ),
+        (
+            "System info",
+            system_message(
+                "Conversation token usage: 450 tokens (350 input, 100 output)",
+                severity="info",
+            ),
+        ),
+    ]
+
+    # These appends are side-effect only (display_conversation re-reads the
+    # context below), so skip parsing the per-turn acks
+    append_turns(context_id, [item for _, item in conversation], wait_response=False)
+    for i, (label, _) in enumerate(conversation, start=1):
+        print(f"[Turn {i}] {label} appended")
 
 
 def display_conversation(context_id: int):
@@ -201,7 +259,7 @@ def display_conversation(context_id: int):
         data = turn.get("data", {})
         item_type = data.get("item_type", "unknown")
         timestamp = data.get("timestamp", 0)
-        dt = datetime.fromtimestamp(timestamp / 1000).strftime("%H:%M:%S")
+        dt = format_clock(timestamp)
 
         print(f"\n[Turn {turn['turn_id']}] {item_type.upper()} @ {dt}")
 
@@ -217,8 +275,9 @@ def display_conversation(context_id: int):
             if tool_calls:
                 print(f"\n  Tool calls:")
                 for tc in tool_calls:
-                    print(f"    - {tc['name']}({json.dumps(tc['arguments'])})")
+                    print(f"    - {tc['name']}({_dumps(tc['arguments'])})")
                     if tc.get("result"):
+                        # Stays on stdlib json: orjson only supports indent=2
                         print(f"      → {json.dumps(tc['result'], indent=8)}")
 
         elif item_type == "system":